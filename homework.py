@@ -1,12 +1,21 @@
 import logging
 import os
+import random
+import signal
 import sys
 import time
+from collections import OrderedDict
 from http import HTTPStatus
 
 import requests
 import telegram
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
 
 load_dotenv()
 
@@ -15,6 +24,13 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+BACKOFF_BASE = 3
+BACKOFF_STEP = 5
+BACKOFF_JITTER = 2
+SENT_CACHE_SIZE = 128
+ERROR_RESEND_PERIOD = 3600
+ERROR_MEMORY_PERIOD = 86400
+ERROR_CACHE_SIZE = 64
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
@@ -23,6 +39,17 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.',
 }
+VERDICT_TEMPLATES = {
+    status: 'Изменился статус проверки работы "%s". ' + verdict
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+REQUEST_TIMEOUT = (5, 30)
+CACHE_VALIDATORS = {'from_date': None, 'etag': None, 'last_modified': None}
+SESSION = requests.Session()
+SESSION.mount(
+    'https://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -93,45 +120,86 @@ def check_tokens() -> None:
     Но если какой-то переменной в окружении нет -
     выбрасывает исключение.
     """
-    TOKENS = {
-        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
-        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
-        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID,
-    }
-    FORGET_TOKENS = []
-    for token_key in TOKENS.keys():
-        if TOKENS[token_key] is None:
-            FORGET_TOKENS.append(token_key)
-    if len(FORGET_TOKENS) != 0:
+    tokens = (
+        ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+        ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+        ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+    )
+    missing_tokens = [name for name, value in tokens if not value]
+    if missing_tokens:
         raise TokenUnexistingException(
             f'Потеряны переменные окружения из '
-            f'этого списка {FORGET_TOKENS}'
+            f'этого списка {missing_tokens}'
         )
 
 
+def get_request_headers(timestamp) -> dict:
+    """Собирает заголовки запроса к API ЯП Домашка.
+
+    К заголовку авторизации добавляет If-None-Match и If-Modified-Since
+    из прошлого ответа, если запрос идет с той же временной меткой.
+    """
+    headers = dict(HEADERS)
+    if CACHE_VALIDATORS['from_date'] != timestamp:
+        return headers
+    if CACHE_VALIDATORS['etag']:
+        headers['If-None-Match'] = CACHE_VALIDATORS['etag']
+    if CACHE_VALIDATORS['last_modified']:
+        headers['If-Modified-Since'] = CACHE_VALIDATORS['last_modified']
+    return headers
+
+
+def reset_cache_validators() -> None:
+    """Забывает ETag и Last-Modified прошлого ответа API ЯП Домашка.
+
+    Вызывается, если ответ не удалось обработать: иначе повторный запрос
+    получит 304 и необработанная домашка будет потеряна.
+    """
+    CACHE_VALIDATORS.update(from_date=None, etag=None, last_modified=None)
+
+
 def get_api_answer(timestamp) -> dict:
     """Делает запрос к API ЯП Домашка с временной меткой timestamp.
 
-    Возвращает ответ от API ЯП Домашка,
-    который мы приводим методом ".json()" к словарю.
+    Возвращает ответ от API ЯП Домашка, приведенный к словарю
+    через orjson (если он установлен) или стандартный json.
+    Запрос идет через общую сессию SESSION, чтобы не открывать
+    новое TCP/TLS соединение на каждый опрос.
     При этом может быть 2 исключения. Прогнозируемое со статусом
     ответа != 200, и общее, если API поломался.
+    Если API ответил 304 (ничего не изменилось) - ответ не разбираем,
+    а сразу сообщаем об отсутствии новых домашек.
     """
     params = {'from_date': timestamp}
     try:
-        response = requests.get(ENDPOINT, headers=HEADERS, params=params)
+        response = SESSION.get(
+            ENDPOINT,
+            headers=get_request_headers(timestamp),
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
     except Exception:
         raise TotallyUnsuccessAnswerException(
             'Вообще не удалось получить ответ от API ЯП Домашка.'
             'Нет доступа к серверам ЯП, чтобы получить подробную ошибку'
         )
     else:
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            raise HomeworksAreAbsentException(
+                'Ответ API ЯП не изменился с прошлого запроса'
+            )
         if response.status_code != HTTPStatus.OK:
             raise UnsuccessAnswerException(
                 'Ответ от API ЯП получен,но статус ответа не "успешный"',
                 'Это внутренняя ошибка на стороне сервера ЯП Домашка.',
             )
-    return response.json()
+    answer = json_parser.loads(response.content)
+    CACHE_VALIDATORS.update(
+        from_date=timestamp,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+    )
+    return answer
 
 
 def check_response(response: dict) -> None:
@@ -144,17 +212,23 @@ def check_response(response: dict) -> None:
     """
     if not isinstance(response, dict):
         raise TypeError('Ответ API ЯП не является словарем, а должен')
-    if ('homeworks' or 'current_date') not in response:
+    if 'homeworks' not in response:
         raise KeyError(
-            'В ответе API ЯП нет ключа homeworks или current_date. '
-            'А это ключи под которыми лежит время запроса и список домашек'
+            'В ответе API ЯП нет ключа homeworks. '
+            'А это ключ, под которым лежит список домашек'
         )
-    if not isinstance(response.get('homeworks'), list):
+    if 'current_date' not in response:
+        raise KeyError(
+            'В ответе API ЯП нет ключа current_date. '
+            'А это ключ, под которым лежит время запроса'
+        )
+    homeworks = response['homeworks']
+    current_date = response['current_date']
+    if not isinstance(homeworks, list):
         raise TypeError('Ответ API ЯП не в виде структуры данных "список".')
-    if not isinstance(response.get('current_date'), int):
+    if not isinstance(current_date, int):
         raise TypeError('API ЯП вернул время запроса в неправильном формате')
-    homeworks = response['homeworks']
-    if len(homeworks) == 0:
+    if not homeworks:
         raise HomeworksAreAbsentException(
             'Ответ API ЯП пришел без данных о новых домашках'
         )
@@ -167,18 +241,18 @@ def parse_status(homework: dict) -> str:
     И отправляет строку с информацией об изменения статуса домашней работы.
     Если данные не валидны - перехватываются исключения.
     """
-    if ('homework_name' or 'status') not in homework:
+    if 'homework_name' not in homework:
         raise KeyError(
-            'Ответ от API ЯП домашка не содержит ключа "homework_name". '
-            'или ключа "status".'
+            'Ответ от API ЯП домашка не содержит ключа "homework_name".'
         )
-    if homework.get('status') not in HOMEWORK_VERDICTS:
+    if 'status' not in homework:
+        raise KeyError('Ответ от API ЯП домашка не содержит ключа "status".')
+    status = homework['status']
+    if status not in HOMEWORK_VERDICTS:
         raise HomeworkStatusIsUncorrectException(
             'У домашней работы некорректный статус.'
         )
-    homework_name = homework['homework_name']
-    verdict = HOMEWORK_VERDICTS[homework['status']]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return VERDICT_TEMPLATES[status] % homework['homework_name']
 
 
 def send_message(bot: telegram.Bot, message: str) -> None:
@@ -190,6 +264,85 @@ def send_message(bot: telegram.Bot, message: str) -> None:
         logger.error(err)
 
 
+def remember_sent(
+    last_sent: OrderedDict, homework_name: str, update: tuple
+) -> None:
+    """Запоминает последнее отправленное обновление по домашней работе.
+
+    Ключ - название работы, значение - пара из date_updated и сообщения,
+    отправленного по ней последним. Хранит не больше SENT_CACHE_SIZE
+    записей: самая давняя запись вытесняется, чтобы память не росла
+    за месяцы работы бота.
+    """
+    last_sent[homework_name] = update
+    last_sent.move_to_end(homework_name)
+    if len(last_sent) > SENT_CACHE_SIZE:
+        last_sent.popitem(last=False)
+
+
+def notify_status(
+    bot: telegram.Bot, homework: dict, last_sent: OrderedDict
+) -> None:
+    """Отправляет в Telegram новый статус домашней работы.
+
+    Не шлем повторно только то же самое обновление: совпадают
+    и сообщение, и date_updated. Тот же статус с новой датой
+    (например, новый круг ревью) отправляется.
+    """
+    homework_name = homework['homework_name']
+    update = (homework.get('date_updated'), parse_status(homework))
+    if last_sent.get(homework_name) == update:
+        return
+    message = update[1]
+    logger.info('Есть обновление %s', message)
+    send_message(bot, message)
+    remember_sent(last_sent, homework_name, update)
+
+
+def report_error(
+    bot: telegram.Bot, message: str, last_error_sent: dict
+) -> None:
+    """Отправляет в Telegram сообщение о сбое.
+
+    Повтор того же сбоя подряд отсекается в main. Здесь же одинаковое
+    сообщение о сбое отправляется не чаще раза в ERROR_RESEND_PERIOD,
+    если между сбоями API отвечал нормально.
+    Записи старше ERROR_MEMORY_PERIOD вычищаются, когда их накопилось
+    больше ERROR_CACHE_SIZE.
+    """
+    now = time.monotonic()
+    sent_at = last_error_sent.get(message)
+    if sent_at is not None and now - sent_at <= ERROR_RESEND_PERIOD:
+        return
+    send_message(bot, message)
+    last_error_sent[message] = now
+    if len(last_error_sent) > ERROR_CACHE_SIZE:
+        for old_message, old_sent_at in list(last_error_sent.items()):
+            if now - old_sent_at >= ERROR_MEMORY_PERIOD:
+                del last_error_sent[old_message]
+
+
+def get_retry_delay(fail_count: int) -> float:
+    """Считает паузу перед повторным запросом после сбоя.
+
+    Первый повтор идет почти сразу, дальше пауза растет линейно
+    с числом сбоев подряд, но не больше RETRY_PERIOD. Случайная добавка
+    разводит по времени повторы разных экземпляров бота.
+    """
+    delay = BACKOFF_BASE + BACKOFF_STEP * fail_count
+    return min(RETRY_PERIOD, delay + random.uniform(0, BACKOFF_JITTER))
+
+
+def stop_polling(signum, frame) -> None:
+    """Останавливает бота по сигналу SIGTERM.
+
+    Heroku завершает воркер сигналом SIGTERM. Переводим его в SystemExit,
+    чтобы цикл в main прервался даже во время сна и сессия была закрыта.
+    """
+    logger.info('Получен сигнал %s, бот останавливается', signum)
+    sys.exit()
+
+
 def main():
     """Основная логика работы бота."""
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
@@ -197,36 +350,50 @@ def main():
     try:
         check_tokens()
     except TokenUnexistingException as token:
-        logger.critical(f'{token}')
+        logger.critical('%s', token)
         sys.exit()
     mistake_info_send_to_bot = None
-    while True:
-        try:
-            response = get_api_answer(timestamp)
-            check_response(response)
-            homework = response.get('homeworks')[0]
-            message = parse_status(homework)
-            logger.info(f'Есть обновление {message}')
-            send_message(bot, message)
-            timestamp = response.get('current_date')
-        except HomeworksAreAbsentException as deb:
-            logger.debug(deb)
-        except (
-            TypeError,
-            KeyError,
-            HomeworkStatusIsUncorrectException,
-            UnsuccessAnswerException,
-            TotallyUnsuccessAnswerException,
-            Exception,
-        ) as err:
-            logger.error(err, exc_info=True)
-            message = f'Сбой в работе программы: {err}'
-            if message != mistake_info_send_to_bot:
-                send_message(bot, message)
-                mistake_info_send_to_bot = message
-        finally:
+    last_error_sent = {}
+    fail_count = 0
+    last_sent = OrderedDict()
+    try:
+        while True:
+            try:
+                response = get_api_answer(timestamp)
+                check_response(response)
+                homework = response.get('homeworks')[0]
+                notify_status(bot, homework, last_sent)
+                timestamp = response.get('current_date')
+            except HomeworksAreAbsentException as deb:
+                logger.debug(deb)
+            except (
+                TypeError,
+                KeyError,
+                HomeworkStatusIsUncorrectException,
+                UnsuccessAnswerException,
+                TotallyUnsuccessAnswerException,
+                Exception,
+            ) as err:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        'Сбой в основном цикле: %s', err, exc_info=True
+                    )
+                reset_cache_validators()
+                message = f'Сбой в работе программы: {err}'
+                if message != mistake_info_send_to_bot:
+                    report_error(bot, message, last_error_sent)
+                    mistake_info_send_to_bot = message
+                delay = get_retry_delay(fail_count)
+                fail_count += 1
+                time.sleep(delay)
+                continue
+            fail_count = 0
+            mistake_info_send_to_bot = None
             time.sleep(RETRY_PERIOD)
+    finally:
+        SESSION.close()
 
 
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, stop_polling)
     main()
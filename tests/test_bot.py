@@ -2,6 +2,7 @@ import inspect
 import logging
 import re
 import time
+from collections import OrderedDict
 from http import HTTPStatus
 
 import pytest
@@ -192,7 +193,7 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_get_call)
+        monkeypatch.setattr(homework_module.SESSION, 'get', check_request_get_call)
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError as e:
@@ -215,7 +216,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
@@ -235,7 +236,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(homework_module.SESSION, 'get', response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -246,6 +247,84 @@ class TestHomework:
                 'ситуация, когда API домашки возвращает код, отличный от 200.'
             )
 
+    def test_get_api_answer_not_modified(self, monkeypatch,
+                                         current_timestamp,
+                                         random_timestamp,
+                                         homework_module):
+        func_name = 'get_api_answer'
+        sent_headers = []
+
+        def mock_response_get(*args, **kwargs):
+            sent_headers.append(kwargs['headers'])
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            if len(sent_headers) == 1:
+                response.headers = {'ETag': '"hw-etag"'}
+            else:
+                response.status_code = HTTPStatus.NOT_MODIFIED
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        monkeypatch.setattr(
+            homework_module,
+            'CACHE_VALIDATORS',
+            dict.fromkeys(('from_date', 'etag', 'last_modified'))
+        )
+        homework_module.get_api_answer(current_timestamp)
+        with pytest.raises(homework_module.HomeworksAreAbsentException):
+            homework_module.get_api_answer(current_timestamp)
+        assert sent_headers[1].get('If-None-Match') == '"hw-etag"', (
+            f'Убедитесь, что функция `{func_name}` передает ETag '
+            'прошлого ответа в заголовке `If-None-Match`.'
+        )
+
+    def test_main_retries_bad_payload_without_validators(
+            self, monkeypatch, random_timestamp, random_message,
+            homework_module
+    ):
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        get_telegram_bot = get_mock_telegram_bot(monkeypatch, random_message)
+        monkeypatch.setattr(telegram, 'Bot', lambda **kwargs: get_telegram_bot)
+        monkeypatch.setattr(
+            homework_module,
+            'CACHE_VALIDATORS',
+            dict.fromkeys(('from_date', 'etag', 'last_modified'))
+        )
+        sent_headers = []
+
+        def mock_response_get(*args, **kwargs):
+            sent_headers.append(kwargs['headers'])
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            if 'If-None-Match' in kwargs['headers']:
+                response.status_code = HTTPStatus.NOT_MODIFIED
+                return response
+            response.headers = {'ETag': '"hw-etag"'}
+            response.json = lambda: {
+                'homeworks': {'homework_name': 'hw123', 'status': 'approved'},
+                'current_date': random_timestamp
+            }
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+
+        def sleep_to_interrupt(secs):
+            if len(sent_headers) > 1:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert 'If-None-Match' not in sent_headers[1], (
+            'Убедитесь, что после ответа 200 с некорректными данными '
+            'повторный запрос не отправляет `If-None-Match` и не получает '
+            '304 вместо необработанной домашки.'
+        )
+
     def test_get_api_answer_with_request_exception(self, current_timestamp,
                                                    monkeypatch,
                                                    homework_module):
@@ -259,7 +338,7 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_request_get_with_exception)
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException:
@@ -509,6 +588,165 @@ class TestHomework:
             except Exception:
                 pass
 
+    def test_retry_delay_backoff(self, homework_module):
+        func_name = 'get_retry_delay'
+        utils.check_function(homework_module, func_name, 1)
+
+        first_delay = homework_module.get_retry_delay(0)
+        assert first_delay < self.RETRY_PERIOD, (
+            'Убедитесь, что после первого сбоя повторный запрос '
+            'отправляется раньше, чем через `RETRY_PERIOD`.'
+        )
+        assert (
+            homework_module.get_retry_delay(3)
+            > homework_module.get_retry_delay(0)
+        ), (
+            'Убедитесь, что пауза растет с числом сбоев подряд.'
+        )
+        assert homework_module.get_retry_delay(1000) <= self.RETRY_PERIOD, (
+            'Убедитесь, что пауза не превышает `RETRY_PERIOD`.'
+        )
+
+    def test_remember_sent_is_bounded(self, homework_module):
+        func_name = 'remember_sent'
+        utils.check_function(homework_module, func_name, 3)
+
+        last_sent = OrderedDict()
+        cache_size = homework_module.SENT_CACHE_SIZE
+        for number in range(cache_size + 1):
+            homework_module.remember_sent(
+                last_sent, f'hw{number}', (None, 'message')
+            )
+        assert len(last_sent) == cache_size, (
+            f'Убедитесь, что функция `{func_name}` хранит не больше '
+            '`SENT_CACHE_SIZE` сообщений.'
+        )
+        assert 'hw0' not in last_sent, (
+            f'Убедитесь, что функция `{func_name}` вытесняет самую давнюю '
+            'запись.'
+        )
+
+    def test_report_error_is_rate_limited(self, monkeypatch,
+                                          homework_module):
+        func_name = 'report_error'
+        utils.check_function(homework_module, func_name, 3)
+
+        sent_messages = []
+
+        def mock_send_message(bot, message=''):
+            sent_messages.append(message)
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        now = 1000.0
+        monkeypatch.setattr(time, 'monotonic', lambda: now)
+
+        last_error_sent = {}
+        homework_module.report_error(None, 'Сбой', last_error_sent)
+        homework_module.report_error(None, 'Сбой', last_error_sent)
+        assert sent_messages == ['Сбой'], (
+            f'Убедитесь, что функция `{func_name}` не отправляет повторно '
+            'то же сообщение о сбое раньше `ERROR_RESEND_PERIOD`.'
+        )
+        now += homework_module.ERROR_RESEND_PERIOD + 1
+        homework_module.report_error(None, 'Сбой', last_error_sent)
+        assert sent_messages == ['Сбой', 'Сбой'], (
+            f'Убедитесь, что функция `{func_name}` снова отправляет '
+            'сообщение о сбое после `ERROR_RESEND_PERIOD`.'
+        )
+
+    def test_notify_status_sends_each_review_round(self, monkeypatch,
+                                                   homework_module):
+        func_name = 'notify_status'
+        utils.check_function(homework_module, func_name, 3)
+
+        sent_messages = []
+
+        def mock_send_message(bot, message=''):
+            sent_messages.append(message)
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        last_sent = OrderedDict()
+        statuses = ('rejected', 'reviewing', 'rejected', 'rejected')
+        for status in statuses:
+            homework_module.notify_status(
+                None, {'homework_name': 'hw123', 'status': status}, last_sent
+            )
+        assert len(sent_messages) == 3, (
+            f'Убедитесь, что функция `{func_name}` отправляет каждую смену '
+            'статуса, в том числе повторный круг ревью, и не отправляет '
+            'повторно неизменившийся статус.'
+        )
+        assert sent_messages[2].endswith(self.HOMEWORK_VERDICTS['rejected']), (
+            f'Убедитесь, что функция `{func_name}` отправляет повторное '
+            'замечание ревьюера.'
+        )
+
+    def test_main_sends_consecutive_error_once(self, monkeypatch,
+                                               random_message,
+                                               homework_module):
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        get_mock_telegram_bot(monkeypatch, random_message)
+
+        def mock_request_get_with_exception(*args, **kwargs):
+            raise requests.RequestException('Something wrong')
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', mock_request_get_with_exception
+        )
+        sent_messages = []
+
+        def mock_send_message(bot, message=''):
+            sent_messages.append(message)
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        clock = [0.0]
+
+        def sleep_with_clock(secs):
+            clock[0] += homework_module.ERROR_RESEND_PERIOD + 1
+            if clock[0] > 3 * homework_module.ERROR_RESEND_PERIOD:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'sleep', sleep_with_clock)
+        monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert len(sent_messages) == 1, (
+            'Убедитесь, что при затяжном сбое одно и то же сообщение '
+            'об ошибке отправляется в Telegram один раз.'
+        )
+
+    def test_notify_status_sends_newer_update(self, monkeypatch,
+                                              homework_module):
+        func_name = 'notify_status'
+        sent_messages = []
+
+        def mock_send_message(bot, message=''):
+            sent_messages.append(message)
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        last_sent = OrderedDict()
+        for date_updated in (
+            '2026-01-01T10:00:00Z',
+            '2026-01-01T10:00:00Z',
+            '2026-01-02T10:05:00Z',
+        ):
+            homework_module.notify_status(
+                None,
+                {
+                    'homework_name': 'hw123',
+                    'status': 'rejected',
+                    'date_updated': date_updated,
+                },
+                last_sent
+            )
+        assert len(sent_messages) == 2, (
+            f'Убедитесь, что функция `{func_name}` отправляет тот же статус '
+            'с новой датой `date_updated` и не отправляет повторно то же '
+            'самое обновление.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -559,9 +797,9 @@ class TestHomework:
         )
 
         def sleep_to_interrupt(secs):
-            assert secs == self.RETRY_PERIOD, (
+            assert 0 < secs <= self.RETRY_PERIOD, (
                 'Убедитесь, что повторный запрос к API домашки отправляется '
-                'через 10 минут: `time.sleep(RETRY_PERIOD)`.'
+                'не реже чем через 10 минут: `time.sleep(RETRY_PERIOD)`.'
             )
             raise utils.BreakInfiniteLoop('break')
 
@@ -587,7 +825,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
 
     def test_main_without_env_vars_raise_exception(
             self, caplog, monkeypatch, random_timestamp, current_timestamp,
@@ -641,7 +879,7 @@ class TestHomework:
                     if record.message == utils.MockResponseGET.CALLED_LOG_MSG
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует сессию `SESSION.get()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -724,7 +962,7 @@ class TestHomework:
                 data=data_with_new_hw_status
             ))
         monkeypatch.setattr(
-            requests,
+            homework_module.SESSION,
             'get',
             mock_response_get_with_new_status
         )